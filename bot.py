@@ -1,11 +1,202 @@
+import asyncio
+import functools
 import logging
 import sys
+import threading
 import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from binance import Client
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from binance import Client, ThreadedWebsocketManager
+from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
 import config
 
+VALID_SIDES = frozenset(('BUY', 'SELL'))
+VALID_TYPES = frozenset(('MARKET', 'LIMIT', 'STOP_LIMIT'))
+LIMIT_TYPES = frozenset(('LIMIT', 'STOP_LIMIT'))
+FINAL_ORDER_STATUSES = frozenset(('FILLED', 'CANCELED', 'REJECTED', 'EXPIRED'))
+
+# Rate-limit rejections; the order was never accepted, so resubmitting is safe
+RETRIABLE_CODES = frozenset((-1003, -1015))
+
+class OrderResult(namedtuple('OrderResult', 'ok order code msg')):
+    """Outcome of an order request; code and msg carry the Binance error on failure"""
+    __slots__ = ()
+    
+    def __bool__(self):
+        # Keep `if result:` meaning success, as when failures returned None
+        return bool(self.ok)
+
+class OrderFilterError(ValueError):
+    """Raised when an order no longer satisfies the exchange filters after rounding"""
+
+# Exchange info shared by every BasicBot instance in the process
+# 'ts' is the last successful fetch, 'attempt_ts' the last background attempt
+_SYMBOL_CACHE = {'set': None, 'meta': None, 'ts': 0.0, 'attempt_ts': float('-inf')}
+# Held while a fetch is in flight so concurrent callers never duplicate it
+_SYMBOL_CACHE_LOCK = threading.Lock()
+
+def _refresh_exchange_info(client):
+    """
+    Fetch futures exchange info and replace the shared symbol cache
+    
+    Args:
+        client (Client): Binance client used to fetch exchange info
+    """
+    exchange_info = client.futures_exchange_info()
+    meta = {
+        s['symbol']: (
+            int(s['pricePrecision']),
+            int(s['quantityPrecision']),
+            {f['filterType']: f for f in s['filters']}
+        )
+        for s in exchange_info['symbols']
+    }
+    _SYMBOL_CACHE.update(meta=meta, set=frozenset(meta), ts=time.monotonic())
+
+def _refresh_exchange_info_async(client):
+    """Background refresh; releases the cache lock taken by the caller"""
+    try:
+        _refresh_exchange_info(client)
+    except Exception as e:
+        logging.getLogger(__name__).error("Error refreshing exchange info: %s", e)
+    finally:
+        _SYMBOL_CACHE_LOCK.release()
+
+def _load_exchange_info(client, ttl):
+    """
+    Get the shared symbol cache, fetching or refreshing it as needed
+    
+    A missing or expired cache is fetched inline. Once the cache is older
+    than config.SYMBOLS_REFRESH_AT of the TTL, the current copy is served
+    and a refresh starts in the background, at most once per
+    config.SYMBOLS_RETRY_INTERVAL so a failing refresh is not hammered.
+    
+    Args:
+        client (Client): Binance client used to fetch exchange info
+        ttl (float): Cache lifetime in seconds
+    
+    Returns:
+        dict: The shared symbol cache
+    """
+    age = time.monotonic() - _SYMBOL_CACHE['ts']
+    if _SYMBOL_CACHE['set'] is None or age > ttl:
+        with _SYMBOL_CACHE_LOCK:
+            # Another thread may have refreshed while we waited for the lock
+            if _SYMBOL_CACHE['set'] is None or time.monotonic() - _SYMBOL_CACHE['ts'] > ttl:
+                _refresh_exchange_info(client)
+    elif (age > config.SYMBOLS_REFRESH_AT * ttl
+            and time.monotonic() - _SYMBOL_CACHE['attempt_ts'] > config.SYMBOLS_RETRY_INTERVAL
+            and _SYMBOL_CACHE_LOCK.acquire(blocking=False)):
+        _SYMBOL_CACHE['attempt_ts'] = time.monotonic()
+        threading.Thread(target=_refresh_exchange_info_async, args=(client,), daemon=True).start()
+    return _SYMBOL_CACHE
+
+def _round_to_step(value, step, rounding):
+    """
+    Round a value to a multiple of an exchange step size
+    
+    Args:
+        value (float): Value to round
+        step (str): Step size as reported by exchange info, e.g. '0.001'
+        rounding (str): decimal rounding mode
+    
+    Returns:
+        str: Rounded value in plain decimal notation, e.g. '0.00001234'
+    """
+    value = Decimal(str(value))
+    step = Decimal(step)
+    if step > 0:
+        value = (value / step).to_integral_value(rounding) * step
+    # str(float) would give '1.234e-05', which the API rejects
+    return format(value.normalize(), 'f')
+
+def get_valid_symbols(client, ttl=config.SYMBOLS_TTL):
+    """
+    Get the set of tradable futures symbols, cached for the TTL window
+    
+    Args:
+        client (Client): Binance client used to fetch exchange info
+        ttl (float): Cache lifetime in seconds
+    
+    Returns:
+        frozenset: Valid trading pair symbols
+    """
+    return _load_exchange_info(client, ttl)['set']
+
+def get_symbol_meta(client, symbol, ttl=config.SYMBOLS_TTL):
+    """
+    Get precision and filter metadata for a symbol, cached for the TTL window
+    
+    Args:
+        client (Client): Binance client used to fetch exchange info
+        symbol (str): Trading pair symbol
+        ttl (float): Cache lifetime in seconds
+    
+    Returns:
+        tuple: (price_precision, quantity_precision, filters by type), or None
+    """
+    return _load_exchange_info(client, ttl)['meta'].get(symbol)
+
+class _BinanceClient(Client):
+    """Thread-safe python-binance Client with a pooled keep-alive session and orjson decoding"""
+    
+    def _init_session(self):
+        session = super()._init_session()
+        # Reuse TCP/TLS connections across calls; Retry only replays idempotent
+        # methods by default, so order POSTs are never resubmitted
+        adapter = HTTPAdapter(
+            pool_connections=config.HTTP_POOL_SIZE,
+            pool_maxsize=config.HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=config.HTTP_MAX_RETRIES,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+    
+    def _request(self, method, uri, signed, force_params=False, **kwargs):
+        # Same as Client._request, but the response stays local: the base class
+        # parks it on self.response, where concurrent worker threads would
+        # swap each other's replies
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+        response = getattr(self.session, method)(uri, **kwargs)
+        return self._handle_response(response)
+    
+    @staticmethod
+    def _handle_response(response):
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise BinanceRequestException('Invalid Response: %s' % response.text)
+
+class _UserStreamManager(ThreadedWebsocketManager):
+    """ThreadedWebsocketManager that honours testnet for futures streams and signals readiness"""
+    
+    def __init__(self, *args, testnet=False, **kwargs):
+        super().__init__(*args, testnet=testnet, **kwargs)
+        self._futures_testnet = testnet
+        self.ready = threading.Event()
+    
+    async def _before_socket_listener_start(self):
+        await super()._before_socket_listener_start()
+        if self._futures_testnet:
+            # futures_socket() always connects to the mainnet FSTREAM_URL, but
+            # the listen key comes from the testnet, so no events would arrive
+            self._bsm.FSTREAM_URL = self._bsm.FSTREAM_TESTNET_URL
+        self.ready.set()
+
 class BasicBot:
     def __init__(self, api_key=None, api_secret=None, testnet=True):
         """
@@ -20,52 +211,67 @@ class BasicBot:
         self.api_secret = api_secret or config.API_SECRET
         self.testnet = testnet
         
+        # Worker threads for concurrent REST calls, sharing the pooled session
+        self._pool = ThreadPoolExecutor(max_workers=config.ORDER_WORKERS)
+        # Set by close() to wake any worker sleeping or waiting on the stream
+        self._closed = threading.Event()
+        
+        # Order updates pushed by the futures user-data stream
+        self._ws = None
+        # Serializes stream start/stop, which may run on different threads
+        self._ws_lock = threading.RLock()
+        # Final updates by order id, most recent last, capped at ORDER_UPDATES_MAX
+        self._order_updates = OrderedDict()
+        self._order_updates_cond = threading.Condition()
+        
         # Setup logging
         self._setup_logging()
         
         # Initialize client
         try:
-            self.client = Client(self.api_key, self.api_secret, testnet=self.testnet)
+            self.client = _BinanceClient(self.api_key, self.api_secret, testnet=self.testnet)
             self.logger.info("Trading bot initialized successfully")
         except Exception as e:
-            self.logger.error(f"Failed to initialize client: {e}")
+            self.logger.error("Failed to initialize client: %s", e)
             raise
     
     def _setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format=config.LOG_FORMAT,
-            handlers=[
-                logging.FileHandler(config.LOG_FILE),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # Only configure handlers once per process, even with several bots
+        if not logging.getLogger().handlers:
+            handlers = [logging.FileHandler(config.LOG_FILE, delay=True)]
+            if sys.stdout.isatty():
+                handlers.append(logging.StreamHandler(sys.stdout))
+            logging.basicConfig(
+                level=logging.INFO,
+                format=config.LOG_FORMAT,
+                handlers=handlers
+            )
         self.logger = logging.getLogger(__name__)
     
     def validate_inputs(self, symbol, quantity, side, order_type, **kwargs):
         """
         Validate trading inputs
         
+        This is the only check place_order performs before dispatching, so
+        it must reject anything the order methods cannot handle.
+        
         Args:
             symbol (str): Trading pair symbol
             quantity (float): Order quantity
-            side (str): BUY or SELL
-            order_type (str): Order type (MARKET, LIMIT, STOP_LIMIT)
+            side (str): BUY or SELL, already uppercased
+            order_type (str): Order type (MARKET, LIMIT, STOP_LIMIT), already uppercased
             **kwargs: Additional parameters
         
         Returns:
             bool: True if inputs are valid
         """
-        valid_sides = ['BUY', 'SELL']
-        valid_types = ['MARKET', 'LIMIT', 'STOP_LIMIT']
-        
-        if side.upper() not in valid_sides:
-            self.logger.error(f"Invalid side: {side}. Must be one of {valid_sides}")
+        if side not in VALID_SIDES:
+            self.logger.error("Invalid side: %s. Must be one of %s", side, sorted(VALID_SIDES))
             return False
         
-        if order_type.upper() not in valid_types:
-            self.logger.error(f"Invalid order type: {order_type}. Must be one of {valid_types}")
+        if order_type not in VALID_TYPES:
+            self.logger.error("Invalid order type: %s. Must be one of %s", order_type, sorted(VALID_TYPES))
             return False
         
         if quantity <= 0:
@@ -74,29 +280,72 @@ class BasicBot:
         
         # Validate symbol exists
         try:
-            exchange_info = self.client.futures_exchange_info()
-            symbols = [s['symbol'] for s in exchange_info['symbols']]
-            if symbol not in symbols:
-                self.logger.error(f"Invalid symbol: {symbol}")
+            if symbol not in get_valid_symbols(self.client):
+                self.logger.error("Invalid symbol: %s", symbol)
                 return False
         except Exception as e:
-            self.logger.error(f"Error validating symbol: {e}")
+            self.logger.error("Error validating symbol: %s", e)
             return False
         
         # Validate limit price for limit orders
-        if order_type.upper() in ['LIMIT', 'STOP_LIMIT']:
+        if order_type in LIMIT_TYPES:
             if 'price' not in kwargs or kwargs['price'] <= 0:
                 self.logger.error("Limit price required for LIMIT and STOP_LIMIT orders")
                 return False
         
         # Validate stop price for stop-limit orders
-        if order_type.upper() == 'STOP_LIMIT':
+        if order_type == 'STOP_LIMIT':
             if 'stop_price' not in kwargs or kwargs['stop_price'] <= 0:
                 self.logger.error("Stop price required for STOP_LIMIT orders")
                 return False
         
         return True
     
+    def get_symbol_meta(self, symbol):
+        """
+        Get precision and filter metadata for a symbol
+        
+        Args:
+            symbol (str): Trading pair symbol
+        
+        Returns:
+            tuple: (price_precision, quantity_precision, filters by type), or None
+        """
+        return get_symbol_meta(self.client, symbol)
+    
+    def _apply_filters(self, symbol, quantity, *prices):
+        """
+        Round quantity and prices to the symbol's exchange filters
+        
+        Quantity is rounded down to the LOT_SIZE step so an order never
+        exceeds what was requested; prices go to the nearest PRICE_FILTER tick.
+        
+        Args:
+            symbol (str): Trading pair symbol
+            quantity (float): Order quantity
+            *prices (float): Prices to round
+        
+        Returns:
+            tuple: Rounded quantity followed by the rounded prices
+        
+        Raises:
+            OrderFilterError: If the quantity or a price rounds to zero
+        """
+        meta = self.get_symbol_meta(symbol)
+        if meta is None:
+            return (quantity,) + prices
+        filters = meta[2]
+        if 'LOT_SIZE' in filters:
+            quantity = _round_to_step(quantity, filters['LOT_SIZE']['stepSize'], ROUND_DOWN)
+            if Decimal(quantity) <= 0:
+                raise OrderFilterError(f"Quantity is below the lot size step for {symbol}")
+        if 'PRICE_FILTER' in filters:
+            tick_size = filters['PRICE_FILTER']['tickSize']
+            prices = tuple(_round_to_step(p, tick_size, ROUND_HALF_UP) for p in prices)
+            if any(Decimal(p) <= 0 for p in prices):
+                raise OrderFilterError(f"Price is below the tick size for {symbol}")
+        return (quantity,) + prices
+    
     def place_market_order(self, symbol, side, quantity):
         """
         Place a market order
@@ -107,10 +356,11 @@ class BasicBot:
             quantity (float): Order quantity
         
         Returns:
-            dict: Order response
+            OrderResult: Order outcome
         """
         try:
-            self.logger.info(f"Placing market order: {side} {quantity} {symbol}")
+            (quantity,) = self._apply_filters(symbol, quantity)
+            self.logger.info("Placing market order: %s %s %s", side, quantity, symbol)
             
             order = self.client.futures_create_order(
                 symbol=symbol,
@@ -119,18 +369,18 @@ class BasicBot:
                 quantity=quantity
             )
             
-            self.logger.info(f"Market order placed successfully: {order}")
-            return order
+            self.logger.info("Market order placed successfully: %r", order)
+            return OrderResult(True, order, None, None)
             
-        except BinanceAPIException as e:
-            self.logger.error(f"Binance API Error in market order: {e}")
-            return None
-        except BinanceOrderException as e:
-            self.logger.error(f"Binance Order Error in market order: {e}")
-            return None
+        except OrderFilterError as e:
+            self.logger.error("Rejected market order: %s", e)
+            return OrderResult(False, None, None, str(e))
+        except (BinanceAPIException, BinanceOrderException) as e:
+            self.logger.error("Binance error in market order: %s", e)
+            return OrderResult(False, None, e.code, e.message)
         except Exception as e:
-            self.logger.error(f"Unexpected error in market order: {e}")
-            return None
+            self.logger.error("Unexpected error in market order: %s", e)
+            return OrderResult(False, None, None, str(e))
     
     def place_limit_order(self, symbol, side, quantity, price):
         """
@@ -143,10 +393,11 @@ class BasicBot:
             price (float): Limit price
         
         Returns:
-            dict: Order response
+            OrderResult: Order outcome
         """
         try:
-            self.logger.info(f"Placing limit order: {side} {quantity} {symbol} @ {price}")
+            quantity, price = self._apply_filters(symbol, quantity, price)
+            self.logger.info("Placing limit order: %s %s %s @ %s", side, quantity, symbol, price)
             
             order = self.client.futures_create_order(
                 symbol=symbol,
@@ -157,18 +408,18 @@ class BasicBot:
                 timeInForce='GTC'  # Good Till Cancelled
             )
             
-            self.logger.info(f"Limit order placed successfully: {order}")
-            return order
+            self.logger.info("Limit order placed successfully: %r", order)
+            return OrderResult(True, order, None, None)
             
-        except BinanceAPIException as e:
-            self.logger.error(f"Binance API Error in limit order: {e}")
-            return None
-        except BinanceOrderException as e:
-            self.logger.error(f"Binance Order Error in limit order: {e}")
-            return None
+        except OrderFilterError as e:
+            self.logger.error("Rejected limit order: %s", e)
+            return OrderResult(False, None, None, str(e))
+        except (BinanceAPIException, BinanceOrderException) as e:
+            self.logger.error("Binance error in limit order: %s", e)
+            return OrderResult(False, None, e.code, e.message)
         except Exception as e:
-            self.logger.error(f"Unexpected error in limit order: {e}")
-            return None
+            self.logger.error("Unexpected error in limit order: %s", e)
+            return OrderResult(False, None, None, str(e))
     
     def place_stop_limit_order(self, symbol, side, quantity, price, stop_price):
         """
@@ -182,10 +433,11 @@ class BasicBot:
             stop_price (float): Stop price
         
         Returns:
-            dict: Order response
+            OrderResult: Order outcome
         """
         try:
-            self.logger.info(f"Placing stop-limit order: {side} {quantity} {symbol} @ {price} (stop: {stop_price})")
+            quantity, price, stop_price = self._apply_filters(symbol, quantity, price, stop_price)
+            self.logger.info("Placing stop-limit order: %s %s %s @ %s (stop: %s)", side, quantity, symbol, price, stop_price)
             
             order = self.client.futures_create_order(
                 symbol=symbol,
@@ -197,18 +449,18 @@ class BasicBot:
                 timeInForce='GTC'
             )
             
-            self.logger.info(f"Stop-limit order placed successfully: {order}")
-            return order
+            self.logger.info("Stop-limit order placed successfully: %r", order)
+            return OrderResult(True, order, None, None)
             
-        except BinanceAPIException as e:
-            self.logger.error(f"Binance API Error in stop-limit order: {e}")
-            return None
-        except BinanceOrderException as e:
-            self.logger.error(f"Binance Order Error in stop-limit order: {e}")
-            return None
+        except OrderFilterError as e:
+            self.logger.error("Rejected stop-limit order: %s", e)
+            return OrderResult(False, None, None, str(e))
+        except (BinanceAPIException, BinanceOrderException) as e:
+            self.logger.error("Binance error in stop-limit order: %s", e)
+            return OrderResult(False, None, e.code, e.message)
         except Exception as e:
-            self.logger.error(f"Unexpected error in stop-limit order: {e}")
-            return None
+            self.logger.error("Unexpected error in stop-limit order: %s", e)
+            return OrderResult(False, None, None, str(e))
     
     def get_order_status(self, symbol, order_id):
         """
@@ -223,12 +475,33 @@ class BasicBot:
         """
         try:
             status = self.client.futures_get_order(symbol=symbol, orderId=order_id)
-            self.logger.info(f"Order status: {status}")
+            self.logger.info("Order status: %r", status)
             return status
         except Exception as e:
-            self.logger.error(f"Error getting order status: {e}")
+            self.logger.error("Error getting order status: %s", e)
             return None
     
+    def poll_order_status(self, symbol, order_id, delays=config.ORDER_POLL_DELAYS):
+        """
+        Poll order status with increasing delays until it reaches a final state
+        
+        Args:
+            symbol (str): Trading pair symbol
+            order_id (int): Order ID
+            delays (tuple): Seconds to sleep between successive polls
+        
+        Returns:
+            dict: Last order status, or None
+        """
+        status = self.get_order_status(symbol, order_id)
+        for delay in delays:
+            if status and status['status'] in FINAL_ORDER_STATUSES:
+                break
+            if self._closed.wait(delay):
+                break
+            status = self.get_order_status(symbol, order_id)
+        return status
+    
     def get_account_balance(self):
         """
         Get USDT balance
@@ -238,15 +511,210 @@ class BasicBot:
         """
         try:
             balance = self.client.futures_account_balance()
-            usdt_balance = next((item for item in balance if item['asset'] == 'USDT'), None)
+            balances = {item['asset']: item for item in balance}
+            usdt_balance = balances.get('USDT')
             if usdt_balance:
-                self.logger.info(f"USDT Balance: {usdt_balance['balance']}")
+                self.logger.info("USDT Balance: %s", usdt_balance['balance'])
                 return float(usdt_balance['balance'])
             return 0.0
         except Exception as e:
-            self.logger.error(f"Error getting balance: {e}")
+            self.logger.error("Error getting balance: %s", e)
             return 0.0
     
+    def start_user_stream(self):
+        """
+        Subscribe to the futures user-data stream for push-based order updates
+        
+        Startup is bounded by config.USER_STREAM_START_TIMEOUT; if the
+        websocket thread fails or stalls, the stream is abandoned.
+        
+        Returns:
+            bool: True if the stream is running
+        """
+        with self._ws_lock:
+            if self._ws is not None:
+                return True
+            if self._closed.is_set():
+                return False
+            ws = _UserStreamManager(api_key=self.api_key, api_secret=self.api_secret, testnet=self.testnet)
+            # A stalled websocket must never keep the process alive
+            ws.daemon = True
+            ws.start()
+            self._ws = ws
+        
+        # Wait outside the lock so close() is never stuck behind startup
+        deadline = time.monotonic() + config.USER_STREAM_START_TIMEOUT
+        while not ws.ready.wait(0.1):
+            if not ws.is_alive() or self._closed.is_set() or time.monotonic() > deadline:
+                self.logger.error("User data stream did not start")
+                self._stop_user_stream(ws)
+                return False
+        
+        with self._ws_lock:
+            if self._ws is not ws:
+                return False  # Stopped while starting
+            try:
+                # Returns immediately now that the socket manager exists
+                ws.start_futures_socket(callback=self._handle_user_event)
+                self.logger.info("User data stream started")
+                return True
+            except Exception as e:
+                self.logger.error("Error starting user data stream: %s", e)
+                self._stop_user_stream(ws)
+                return False
+    
+    def stop_user_stream(self):
+        """Stop the futures user-data stream if it is running"""
+        self._stop_user_stream(self._ws)
+    
+    def _stop_user_stream(self, ws):
+        """
+        Stop a websocket manager if it is still the bot's current stream
+        
+        Args:
+            ws (ThreadedWebsocketManager): Manager to stop
+        """
+        with self._ws_lock:
+            if ws is None or self._ws is not ws:
+                return
+            self._ws = None
+        try:
+            ws.stop()
+        except Exception as e:
+            self.logger.error("Error stopping user data stream: %s", e)
+    
+    def close(self):
+        """
+        Release the user-data stream and worker pool
+        
+        Wakes workers blocked in backoff sleeps or stream waits and drops
+        queued calls, so no pool thread outlives the caller for long.
+        """
+        self._closed.set()
+        with self._order_updates_cond:
+            self._order_updates_cond.notify_all()
+        self.stop_user_stream()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _handle_user_event(self, msg):
+        """
+        Record order updates from the user-data stream
+        
+        Args:
+            msg (dict): Raw user-data stream event
+        """
+        if msg.get('e') == 'error':
+            self.logger.error("User data stream error: %s", msg.get('m'))
+            return
+        if msg.get('e') != 'ORDER_TRADE_UPDATE':
+            return
+        
+        update = msg['o']
+        # Only final updates can satisfy wait_for_order_update
+        if update['X'] not in FINAL_ORDER_STATUSES:
+            return
+        
+        # Same keys as the futures_get_order response
+        status = {
+            'symbol': update['s'],
+            'orderId': update['i'],
+            'status': update['X'],
+            'executedQty': update['z'],
+            'avgPrice': update['ap']
+        }
+        with self._order_updates_cond:
+            # The stream carries every order on the account, and a fill can
+            # arrive before the REST response names the order we wait for,
+            # so keep a bounded window of recent updates
+            self._order_updates[update['i']] = status
+            while len(self._order_updates) > config.ORDER_UPDATES_MAX:
+                self._order_updates.popitem(last=False)
+            self._order_updates_cond.notify_all()
+    
+    def wait_for_order_update(self, order_id, timeout=config.ORDER_STATUS_TIMEOUT):
+        """
+        Wait for the user-data stream to report a final order status
+        
+        Args:
+            order_id (int): Order ID
+            timeout (float): Maximum seconds to wait
+        
+        Returns:
+            dict: Final streamed order status, or None on timeout
+        """
+        with self._order_updates_cond:
+            self._order_updates_cond.wait_for(
+                lambda: self._closed.is_set() or order_id in self._order_updates,
+                timeout=timeout
+            )
+            return self._order_updates.pop(order_id, None)
+    
+    def run_blocking(self, fn, *args, **kwargs):
+        """
+        Run a blocking bot call on the bot's worker pool
+        
+        The call is submitted immediately, so several REST requests can be
+        in flight at once and awaited together.
+        
+        Args:
+            fn (callable): Blocking function to run
+            *args, **kwargs: Arguments passed to fn
+        
+        Returns:
+            asyncio.Future: Future resolving to the result of fn
+        """
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+    
+    async def place_orders(self, batch):
+        """
+        Place several orders concurrently
+        
+        Args:
+            batch (list): Order dicts with place_order keyword arguments
+        
+        Returns:
+            list: OrderResults, in the same order as batch
+        """
+        return await asyncio.gather(*(self.run_blocking(self.place_order, **order) for order in batch))
+    
+    def place_orders_parallel(self, orders):
+        """
+        Place several orders concurrently without an event loop
+        
+        Args:
+            orders (list): Order dicts with place_order keyword arguments
+        
+        Returns:
+            list: OrderResults, in the same order as orders
+        """
+        futures = [self._pool.submit(self.place_order, **order) for order in orders]
+        return [future.result() for future in futures]
+    
+    def submit_with_retry(self, fn, *args, retriable_codes=RETRIABLE_CODES, max_retries=config.ORDER_MAX_RETRIES, **kwargs):
+        """
+        Call an order method, retrying with exponential backoff on retriable errors
+        
+        Args:
+            fn (callable): Order method returning an OrderResult
+            *args, **kwargs: Arguments passed to fn
+            retriable_codes (frozenset): Binance error codes worth retrying
+            max_retries (int): Maximum number of retries
+        
+        Returns:
+            OrderResult: Outcome of the last attempt
+        """
+        result = fn(*args, **kwargs)
+        for attempt in range(max_retries):
+            if result.ok or result.code not in retriable_codes:
+                break
+            delay = config.RETRY_BACKOFF * 2 ** attempt
+            self.logger.warning("Retrying after Binance error %s in %.2fs", result.code, delay)
+            if self._closed.wait(delay):
+                break
+            result = fn(*args, **kwargs)
+        return result
+    
     def place_order(self, symbol, side, order_type, quantity, **kwargs):
         """
         Main order placement method
@@ -259,33 +727,29 @@ class BasicBot:
             **kwargs: Additional parameters (price, stop_price)
         
         Returns:
-            dict: Order response
+            OrderResult: Order outcome
         """
-        # Validate inputs
-        if not self.validate_inputs(symbol, quantity, side, order_type, **kwargs):
-            return None
-        
-        # Place order based on type
+        # Normalize once; validate_inputs and the order methods expect uppercase
+        side = side.upper()
         order_type = order_type.upper()
         
+        # validate_inputs guarantees the price/stop_price each order type needs
+        if not self.validate_inputs(symbol, quantity, side, order_type, **kwargs):
+            return OrderResult(False, None, None, "Invalid order parameters")
+        
+        # Place order based on type, retrying on rate-limit rejections
         if order_type == 'MARKET':
-            return self.place_market_order(symbol, side, quantity)
+            return self.submit_with_retry(self.place_market_order, symbol, side, quantity)
         
         elif order_type == 'LIMIT':
-            if 'price' not in kwargs:
-                self.logger.error("Price required for limit orders")
-                return None
-            return self.place_limit_order(symbol, side, quantity, kwargs['price'])
+            return self.submit_with_retry(self.place_limit_order, symbol, side, quantity, kwargs['price'])
         
         elif order_type == 'STOP_LIMIT':
-            if 'price' not in kwargs or 'stop_price' not in kwargs:
-                self.logger.error("Price and stop_price required for stop-limit orders")
-                return None
-            return self.place_stop_limit_order(symbol, side, quantity, kwargs['price'], kwargs['stop_price'])
+            return self.submit_with_retry(self.place_stop_limit_order, symbol, side, quantity, kwargs['price'], kwargs['stop_price'])
         
         else:
-            self.logger.error(f"Unsupported order type: {order_type}")
-            return None
+            self.logger.error("Unsupported order type: %s", order_type)
+            return OrderResult(False, None, None, f"Unsupported order type: {order_type}")
 
 def main():
     """Command-line interface for the trading bot"""
@@ -295,9 +759,9 @@ def main():
     
     # Required arguments
     parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTCUSDT)')
-    parser.add_argument('--side', required=True, choices=['BUY', 'SELL'], help='Order side')
+    parser.add_argument('--side', required=True, choices=sorted(VALID_SIDES), help='Order side')
     parser.add_argument('--quantity', required=True, type=float, help='Order quantity')
-    parser.add_argument('--order-type', required=True, choices=['MARKET', 'LIMIT', 'STOP_LIMIT'], 
+    parser.add_argument('--order-type', required=True, choices=sorted(VALID_TYPES), 
                        help='Order type')
     
     # Optional arguments
@@ -322,9 +786,57 @@ def main():
     if args.stop_price:
         order_params['stop_price'] = args.stop_price
     
-    # Display account balance
-    balance = bot.get_account_balance()
-    print(f"Current USDT Balance: {balance}")
+    try:
+        asyncio.run(_run(bot, args, order_params))
+    finally:
+        bot.close()
+
+async def _prompt(message):
+    """
+    Read a line of input without blocking the event loop
+    
+    input() runs on a daemon thread rather than an executor, so Ctrl-C at
+    the prompt exits immediately instead of waiting for the read to return.
+    
+    Args:
+        message (str): Prompt to display
+    
+    Returns:
+        str: Line entered by the user
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(value, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+    
+    def read():
+        try:
+            value, error = input(message), None
+        except Exception as e:
+            value, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, value, error)
+        except RuntimeError:
+            pass  # Loop already closed after Ctrl-C
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+async def _run(bot, args, order_params):
+    """Display balance, confirm and execute the order requested on the command line"""
+    # Start the user-data stream, balance fetch and order validation right away
+    # so the round-trips complete while the user reads the confirmation prompt.
+    # Only market orders wait on the stream; resting orders get one status check
+    resting = args.order_type in LIMIT_TYPES
+    stream_task = None if resting else bot.run_blocking(bot.start_user_stream)
+    balance_task = bot.run_blocking(bot.get_account_balance)
+    valid_task = bot.run_blocking(bot.validate_inputs, args.symbol, args.quantity, args.side, args.order_type, **order_params)
     
     # Place order
     print(f"\nPlacing {args.order_type} order:")
@@ -336,13 +848,20 @@ def main():
     if args.stop_price:
         print(f"Stop Price: {args.stop_price}")
     
-    confirmation = input("\nConfirm order? (y/n): ")
+    confirmation = await _prompt("\nConfirm order? (y/n): ")
     if confirmation.lower() != 'y':
         print("Order cancelled")
         return
     
+    # Only wait for what the order needs; the stream and balance are optional
+    valid = await valid_task
+    if not valid:
+        print("\n❌ Invalid order parameters. Check logs for details.")
+        return
+    
     # Execute order
-    result = bot.place_order(
+    result = await bot.run_blocking(
+        bot.place_order,
         symbol=args.symbol,
         side=args.side,
         order_type=args.order_type,
@@ -350,21 +869,32 @@ def main():
         **order_params
     )
     
-    if result:
+    balance = await balance_task
+    print(f"\nUSDT Balance (before order): {balance}")
+    
+    if result.ok:
+        order = result.order
         print(f"\n✅ Order placed successfully!")
-        print(f"Order ID: {result['orderId']}")
-        print(f"Status: {result['status']}")
+        print(f"Order ID: {order['orderId']}")
+        print(f"Status: {order['status']}")
         
         # Display order details
-        if 'price' in result:
-            print(f"Price: {result['price']}")
-        if 'stopPrice' in result:
-            print(f"Stop Price: {result['stopPrice']}")
+        if 'price' in order:
+            print(f"Price: {order['price']}")
+        if 'stopPrice' in order:
+            print(f"Stop Price: {order['stopPrice']}")
         
-        # Check order status after a brief delay
+        # Market orders wait for the pushed update, falling back to REST polling
         print("\nChecking order status...")
-        time.sleep(2)
-        status = bot.get_order_status(args.symbol, result['orderId'])
+        if resting:
+            status = await bot.run_blocking(bot.get_order_status, args.symbol, order['orderId'])
+        # Use the stream only if it was up by now; never hold the order for it
+        elif stream_task.done() and not stream_task.exception() and stream_task.result():
+            status = await bot.run_blocking(bot.wait_for_order_update, order['orderId'])
+            if status is None:
+                status = await bot.run_blocking(bot.get_order_status, args.symbol, order['orderId'])
+        else:
+            status = await bot.run_blocking(bot.poll_order_status, args.symbol, order['orderId'])
         if status:
             print(f"Current Status: {status['status']}")
             if status['status'] == 'FILLED':
@@ -373,7 +903,7 @@ def main():
                     print(f"Average Price: {status['avgPrice']}")
     
     else:
-        print(f"\n❌ Failed to place order. Check logs for details.")
+        print(f"\n❌ Failed to place order: {result.msg}. Check logs for details.")
 
 if __name__ == "__main__":
     main()
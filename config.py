@@ -8,6 +8,11 @@ TESTNET_BASE_URL = "https://testnet.binancefuture.com"
 API_KEY = os.getenv('BINANCE_TESTNET_API_KEY')
 API_SECRET = os.getenv('BINANCE_TESTNET_API_SECRET')
 
+# HTTP Configuration
+HTTP_POOL_SIZE = 10
+ORDER_WORKERS = 8  # Threads for concurrent REST calls
+HTTP_MAX_RETRIES = 3
+
 # Logging Configuration
 LOG_FILE = "logs/trading.log"
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -15,3 +20,12 @@ LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 # Trading Configuration
 DEFAULT_SYMBOL = "BTCUSDT"
 DEFAULT_QUANTITY = 0.001
+SYMBOLS_TTL = 3600  # Seconds to cache exchange symbols
+SYMBOLS_REFRESH_AT = 0.8  # Fraction of the TTL after which symbols refresh in the background
+SYMBOLS_RETRY_INTERVAL = 60  # Minimum seconds between background refresh attempts
+USER_STREAM_START_TIMEOUT = 5  # Seconds to wait for the user-data stream to connect
+ORDER_STATUS_TIMEOUT = 2  # Seconds to wait for a streamed order update
+ORDER_UPDATES_MAX = 100  # Streamed final order updates kept for waiters
+ORDER_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)  # Backoff between REST status polls
+ORDER_MAX_RETRIES = 3  # Retries for rate-limited orders
+RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubled each time
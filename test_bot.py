@@ -0,0 +1,318 @@
+import asyncio
+import logging
+import threading
+import time
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+try:
+    import bot
+except ImportError:  # python-binance and friends not installed
+    bot = None
+
+# Keep BasicBot from installing file/stdout handlers during tests
+logging.getLogger().addHandler(logging.NullHandler())
+
+EXCHANGE_INFO = {
+    'symbols': [
+        {
+            'symbol': 'BTCUSDT',
+            'pricePrecision': 2,
+            'quantityPrecision': 3,
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'tickSize': '0.10'},
+                {'filterType': 'LOT_SIZE', 'stepSize': '0.001'}
+            ]
+        }
+    ]
+}
+
+class FakeClient:
+    """Stands in for the python-binance Client"""
+
+    def __init__(self):
+        self.info_calls = 0
+        self.orders = []
+
+    def futures_exchange_info(self):
+        self.info_calls += 1
+        return EXCHANGE_INFO
+
+    def futures_create_order(self, **params):
+        self.orders.append(params)
+        return dict(params, orderId=len(self.orders), status='NEW')
+
+def reset_symbol_cache():
+    bot._SYMBOL_CACHE.update(set=None, meta=None, ts=0.0, attempt_ts=float('-inf'))
+
+def wait_for_refresh():
+    """Block until no exchange-info fetch holds the cache lock"""
+    assert bot._SYMBOL_CACHE_LOCK.acquire(timeout=1), "refresh never released the lock"
+    bot._SYMBOL_CACHE_LOCK.release()
+
+@unittest.skipIf(bot is None, "bot dependencies are not installed")
+class BotTestCase(unittest.TestCase):
+    def setUp(self):
+        reset_symbol_cache()
+        self.client = FakeClient()
+        with mock.patch.object(bot, '_BinanceClient', return_value=self.client):
+            self.bot = bot.BasicBot(api_key='key', api_secret='secret')
+
+    def tearDown(self):
+        self.bot.close()
+
+class TestOrderFilters(BotTestCase):
+    def test_quantity_rounds_down_to_lot_size(self):
+        result = self.bot.place_market_order('BTCUSDT', 'BUY', 0.0019)
+        self.assertTrue(result.ok)
+        self.assertEqual(self.client.orders[0]['quantity'], '0.001')
+
+    def test_price_rounds_to_tick_size(self):
+        result = self.bot.place_limit_order('BTCUSDT', 'BUY', 0.001, 101.234)
+        self.assertTrue(result.ok)
+        self.assertEqual(self.client.orders[0]['price'], '101.2')
+
+    def test_fine_steps_are_sent_without_exponent(self):
+        self.assertEqual(bot._round_to_step(0.00001234, '0.00000001', bot.ROUND_HALF_UP), '0.00001234')
+        self.assertEqual(bot._round_to_step(120, '10', bot.ROUND_DOWN), '120')
+
+    def test_price_below_tick_size_is_rejected(self):
+        result = self.bot.place_limit_order('BTCUSDT', 'BUY', 0.001, 0.04)
+        self.assertFalse(result.ok)
+        self.assertEqual(result.msg, "Price is below the tick size for BTCUSDT")
+        self.assertEqual(self.client.orders, [])
+
+    def test_quantity_below_lot_size_is_rejected(self):
+        results = self.bot.place_orders_parallel([
+            {'symbol': 'BTCUSDT', 'side': 'SELL', 'order_type': 'MARKET', 'quantity': 0.0004}
+        ])
+        self.assertFalse(results[0].ok)
+        self.assertEqual(self.client.orders, [])
+
+class TestSubmitWithRetry(BotTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sleeps = []
+        self.bot._closed = mock.Mock()
+        self.bot._closed.wait.side_effect = self.record_sleep
+
+    def record_sleep(self, delay):
+        self.sleeps.append(delay)
+        return False
+
+    def order_fn(self, *results):
+        return mock.Mock(side_effect=list(results))
+
+    def test_failed_result_is_falsy(self):
+        self.assertFalse(bot.OrderResult(False, None, -2010, 'insufficient balance'))
+        self.assertTrue(bot.OrderResult(True, {'orderId': 1}, None, None))
+
+    def test_retries_rate_limit_then_succeeds(self):
+        fn = self.order_fn(
+            bot.OrderResult(False, None, -1003, 'too many requests'),
+            bot.OrderResult(True, {'orderId': 1}, None, None)
+        )
+        result = self.bot.submit_with_retry(fn, 'BTCUSDT', side='BUY')
+        self.assertTrue(result.ok)
+        self.assertEqual(fn.call_count, 2)
+        fn.assert_called_with('BTCUSDT', side='BUY')
+        self.assertEqual(self.sleeps, [bot.config.RETRY_BACKOFF])
+
+    def test_does_not_retry_other_errors(self):
+        fn = self.order_fn(bot.OrderResult(False, None, -2010, 'insufficient balance'))
+        result = self.bot.submit_with_retry(fn)
+        self.assertEqual(result.code, -2010)
+        self.assertEqual(fn.call_count, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_gives_up_after_max_retries_with_doubling_backoff(self):
+        limited = bot.OrderResult(False, None, -1015, 'too many orders')
+        fn = self.order_fn(*[limited] * 4)
+        result = self.bot.submit_with_retry(fn, max_retries=3)
+        self.assertIs(result, limited)
+        self.assertEqual(fn.call_count, 4)
+        backoff = bot.config.RETRY_BACKOFF
+        self.assertEqual(self.sleeps, [backoff, backoff * 2, backoff * 4])
+
+    def test_close_stops_retrying(self):
+        self.bot._closed.wait.side_effect = lambda delay: True
+        fn = self.order_fn(bot.OrderResult(False, None, -1003, 'too many requests'))
+        result = self.bot.submit_with_retry(fn)
+        self.assertFalse(result.ok)
+        self.assertEqual(fn.call_count, 1)
+
+class NeverReadyStreamManager(threading.Thread):
+    """Websocket manager whose socket manager never comes up"""
+    lifetime = 0  # Seconds the websocket thread stays alive
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.ready = threading.Event()
+
+    def run(self):
+        time.sleep(self.lifetime)
+
+    def start_futures_socket(self, callback):
+        raise AssertionError("socket started without a ready manager")
+
+    def stop(self):
+        pass
+
+class TestUserStreamStartup(BotTestCase):
+    def test_dead_websocket_thread_gives_up_and_close_returns(self):
+        with mock.patch.object(bot, '_UserStreamManager', NeverReadyStreamManager):
+            self.assertFalse(self.bot.start_user_stream())
+        self.assertIsNone(self.bot._ws)
+        self.bot.close()
+
+    def test_stalled_startup_times_out(self):
+        class StalledStreamManager(NeverReadyStreamManager):
+            lifetime = 1
+
+        with mock.patch.object(bot, '_UserStreamManager', StalledStreamManager), \
+                mock.patch.object(bot.config, 'USER_STREAM_START_TIMEOUT', 0.2):
+            started = time.monotonic()
+            self.assertFalse(self.bot.start_user_stream())
+            self.assertLess(time.monotonic() - started, 1)
+        self.assertIsNone(self.bot._ws)
+
+@unittest.skipIf(bot is None, "bot dependencies are not installed")
+class TestUserStreamTestnet(unittest.TestCase):
+    def start_listener(self, testnet):
+        socket_manager = types.SimpleNamespace(FSTREAM_URL='wss://mainnet/', FSTREAM_TESTNET_URL='wss://testnet/')
+
+        async def create_socket_manager(manager):
+            manager._bsm = socket_manager
+
+        manager = bot._UserStreamManager.__new__(bot._UserStreamManager)
+        manager._futures_testnet = testnet
+        manager.ready = threading.Event()
+        with mock.patch.object(bot.ThreadedWebsocketManager, '_before_socket_listener_start',
+                               create_socket_manager, create=True):
+            asyncio.run(manager._before_socket_listener_start())
+        self.assertTrue(manager.ready.is_set())
+        return socket_manager.FSTREAM_URL
+
+    def test_testnet_uses_testnet_futures_stream(self):
+        self.assertEqual(self.start_listener(testnet=True), 'wss://testnet/')
+
+    def test_mainnet_keeps_mainnet_futures_stream(self):
+        self.assertEqual(self.start_listener(testnet=False), 'wss://mainnet/')
+
+def order_update(order_id, status):
+    return {
+        'e': 'ORDER_TRADE_UPDATE',
+        'o': {'s': 'BTCUSDT', 'i': order_id, 'X': status, 'z': '0.001', 'ap': '100.0'}
+    }
+
+class TestOrderUpdates(BotTestCase):
+    def test_final_update_is_returned(self):
+        self.bot._handle_user_event(order_update(1, 'FILLED'))
+        status = self.bot.wait_for_order_update(1, timeout=0)
+        self.assertEqual(status['status'], 'FILLED')
+        self.assertEqual(status['executedQty'], '0.001')
+
+    def test_non_final_update_times_out_with_none(self):
+        self.bot._handle_user_event(order_update(1, 'NEW'))
+        self.bot._handle_user_event(order_update(1, 'PARTIALLY_FILLED'))
+        self.assertIsNone(self.bot.wait_for_order_update(1, timeout=0.05))
+
+    def test_waiter_wakes_on_pushed_update(self):
+        threading.Timer(0.05, self.bot._handle_user_event, args=(order_update(1, 'CANCELED'),)).start()
+        status = self.bot.wait_for_order_update(1, timeout=1)
+        self.assertEqual(status['status'], 'CANCELED')
+
+    def test_oldest_updates_are_evicted(self):
+        with mock.patch.object(bot.config, 'ORDER_UPDATES_MAX', 2):
+            for order_id in (1, 2, 3):
+                self.bot._handle_user_event(order_update(order_id, 'FILLED'))
+        self.assertEqual(list(self.bot._order_updates), [2, 3])
+        self.assertIsNone(self.bot.wait_for_order_update(1, timeout=0))
+
+    def test_other_events_are_ignored(self):
+        self.bot._handle_user_event({'e': 'ACCOUNT_UPDATE'})
+        self.bot._handle_user_event({'e': 'error', 'm': 'connection lost'})
+        self.assertEqual(len(self.bot._order_updates), 0)
+
+@unittest.skipIf(bot is None, "bot dependencies are not installed")
+class TestSymbolCacheRefresh(unittest.TestCase):
+    TTL = 100
+
+    def setUp(self):
+        reset_symbol_cache()
+        bot.get_valid_symbols(FakeClient(), ttl=self.TTL)
+        # Age the cache into the background-refresh window
+        bot._SYMBOL_CACHE['ts'] -= 0.9 * self.TTL
+
+    def tearDown(self):
+        wait_for_refresh()
+        reset_symbol_cache()
+
+    def test_stale_cache_is_served_while_one_refresh_runs(self):
+        release = threading.Event()
+        client = FakeClient()
+        fetch = client.futures_exchange_info
+
+        def slow_fetch():
+            release.wait(timeout=1)
+            return fetch()
+        client.futures_exchange_info = slow_fetch
+
+        stale_ts = bot._SYMBOL_CACHE['ts']
+        for _ in range(3):
+            self.assertIn('BTCUSDT', bot.get_valid_symbols(client, ttl=self.TTL))
+        release.set()
+        wait_for_refresh()
+        self.assertEqual(client.info_calls, 1)
+        self.assertGreater(bot._SYMBOL_CACHE['ts'], stale_ts)
+
+    def test_failed_refresh_releases_lock_and_is_rate_limited(self):
+        client = mock.Mock()
+        client.futures_exchange_info.side_effect = RuntimeError("exchange down")
+
+        bot.get_valid_symbols(client, ttl=self.TTL)
+        wait_for_refresh()
+        for _ in range(3):
+            self.assertIn('BTCUSDT', bot.get_valid_symbols(client, ttl=self.TTL))
+        wait_for_refresh()
+        self.assertEqual(client.futures_exchange_info.call_count, 1)
+
+        # Once the retry interval has passed, the next call tries again
+        bot._SYMBOL_CACHE['attempt_ts'] -= bot.config.SYMBOLS_RETRY_INTERVAL + 1
+        bot.get_valid_symbols(client, ttl=self.TTL)
+        wait_for_refresh()
+        self.assertEqual(client.futures_exchange_info.call_count, 2)
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self.content = body
+        self.text = body.decode()
+
+@unittest.skipIf(bot is None, "bot dependencies are not installed")
+class TestClientThreadSafety(unittest.TestCase):
+    def test_concurrent_requests_keep_their_own_response(self):
+        both_sent = threading.Barrier(2)
+
+        class Session:
+            def get(self, uri, **kwargs):
+                both_sent.wait(timeout=1)
+                return FakeResponse(b'{"uri": "%s"}' % uri.encode())
+
+            def close(self):
+                # Client.__del__ closes the session via close_connection()
+                pass
+
+        client = bot._BinanceClient.__new__(bot._BinanceClient)
+        client.session = Session()
+        client._get_request_kwargs = lambda method, signed, force_params, **kwargs: kwargs
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(client._request, 'get', uri, False) for uri in ('a', 'b')]
+            self.assertEqual([f.result()['uri'] for f in futures], ['a', 'b'])
+
+if __name__ == '__main__':
+    unittest.main()